@@ -0,0 +1,286 @@
+"""Command model and sync steps shared by `monty_sync.py`.
+
+The preflight, remote configuration, and verification gate steps live here so
+the entrypoint module stays focused on configuration, Cuprum execution, and
+the fork refresh.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol, TextIO
+
+if TYPE_CHECKING:
+    from monty_sync import SyncConfig
+
+
+# `git remote get-url` exits with this code when the named remote is absent.
+GIT_NO_SUCH_REMOTE_EXIT_CODE = 2
+
+
+@dataclass(frozen=True, slots=True)
+class CommandOutcome:
+    """Represent one command result consumed by sync orchestration.
+
+    Parameters
+    ----------
+    ok : bool
+    stdout : str
+    stderr : str
+    exit_code : int
+    """
+
+    ok: bool
+    stdout: str
+    stderr: str
+    exit_code: int
+
+
+@dataclass(frozen=True, slots=True)
+class CommandInvocation:
+    """Describe one command invocation expected by a command runner.
+
+    Parameters
+    ----------
+    program : str
+    args : tuple[str, ...]
+    cwd : Path
+    """
+
+    program: str
+    args: tuple[str, ...]
+    cwd: Path
+
+
+class CommandRunner(Protocol):
+    """Define the command runner contract used by monty-sync orchestration."""
+
+    def run(self, *, program: str, args: tuple[str, ...], cwd: Path) -> CommandOutcome:
+        """Execute one command invocation.
+
+        Parameters
+        ----------
+        program : str
+        args : tuple[str, ...]
+        cwd : Path
+
+        Returns
+        -------
+        CommandOutcome
+        """
+
+
+class MontySyncError(RuntimeError):
+    """Signal a fail-closed monty-sync orchestration error."""
+
+
+def run_checked(
+    runner: CommandRunner,
+    *,
+    invocation: CommandInvocation,
+    failure_summary: str,
+) -> CommandOutcome:
+    """Execute one command and raise `MontySyncError` on failure."""
+    outcome = runner.run(program=invocation.program, args=invocation.args, cwd=invocation.cwd)
+    if outcome.ok:
+        return outcome
+    raise command_failure(invocation, outcome, failure_summary=failure_summary)
+
+
+def command_failure(
+    invocation: CommandInvocation,
+    outcome: CommandOutcome,
+    *,
+    failure_summary: str,
+) -> MontySyncError:
+    """Build the fail-closed error for one unsuccessful command."""
+    details = outcome.stderr.strip() or outcome.stdout.strip() or "no error detail"
+    command_text = " ".join((invocation.program, *invocation.args))
+    return MontySyncError(
+        f"{failure_summary}: `{command_text}` failed with exit code "
+        f"{outcome.exit_code}: {details}"
+    )
+
+
+def log(stdout: TextIO, message: str) -> None:
+    """Write one log line to output stream."""
+    stdout.write(f"{message}\n")
+
+
+def _ensure_clean_worktree(runner: CommandRunner, *, cwd: Path, scope_name: str) -> None:
+    """Fail when `cwd` worktree has tracked or untracked changes."""
+    outcome = run_checked(
+        runner,
+        invocation=CommandInvocation(program="git", args=("status", "--porcelain"), cwd=cwd),
+        failure_summary=f"unable to inspect {scope_name} worktree status",
+    )
+    if outcome.stdout.strip():
+        raise _dirty_worktree_error(scope_name)
+
+
+def _ensure_clean_superproject(runner: CommandRunner, *, config: SyncConfig) -> bool:
+    """Fail when the superproject has changes outside the submodule path.
+
+    Submodule state is included regardless of local `ignore` settings, so a
+    clean result also vouches for the submodule checkout and no
+    submodule-scoped status is needed.
+
+    Returns
+    -------
+    bool
+        `True` when the superproject reports the submodule path as modified.
+        Callers must still fail in that case; see `_reject_changed_submodule`.
+    """
+    outcome = run_checked(
+        runner,
+        invocation=CommandInvocation(
+            program="git",
+            args=("status", "--porcelain", "--ignore-submodules=none"),
+            cwd=config.repo_root,
+        ),
+        failure_summary="unable to inspect superproject worktree status",
+    )
+    submodule_changed = False
+    for line in outcome.stdout.splitlines():
+        if line.startswith(" ") and line[3:] == config.submodule_posix:
+            submodule_changed = True
+        elif line.strip():
+            raise _dirty_worktree_error("superproject")
+    return submodule_changed
+
+
+def _reject_changed_submodule(runner: CommandRunner, *, config: SyncConfig) -> MontySyncError:
+    """Build the error for a submodule the superproject reports as modified.
+
+    The submodule worktree is inspected only to choose the diagnostic: dirty
+    content fails as a dirty submodule worktree. A clean worktree means the
+    checkout is on commits the superproject has not recorded, which the
+    submodule update and branch reset would otherwise discard.
+    """
+    _ensure_clean_worktree(runner, cwd=config.submodule_root, scope_name="full-monty submodule")
+    return MontySyncError(
+        f"{config.submodule_posix} is checked out at a commit the superproject has not "
+        "recorded; commit the submodule pointer or reset the submodule before running "
+        "monty sync"
+    )
+
+
+def _dirty_worktree_error(scope_name: str) -> MontySyncError:
+    """Build the error raised when one worktree has local changes."""
+    return MontySyncError(
+        f"{scope_name} worktree is not clean; commit or stash changes before running monty sync"
+    )
+
+
+def _initialize_submodule(runner: CommandRunner, *, config: SyncConfig) -> None:
+    """Initialize and check out the full-monty submodule recursively."""
+    run_checked(
+        runner,
+        invocation=CommandInvocation(
+            program="git",
+            args=(
+                "submodule",
+                "update",
+                "--init",
+                "--recursive",
+                f"--jobs={config.submodule_jobs}",
+                config.submodule_posix,
+            ),
+            cwd=config.repo_root,
+        ),
+        failure_summary="unable to initialize full-monty submodule",
+    )
+
+
+def run_preflight(runner: CommandRunner, *, config: SyncConfig, stdout: TextIO) -> None:
+    """Check superproject cleanliness, then initialize the submodule.
+
+    The cleanliness checks complete before `git submodule update` runs, so a
+    dirty superproject or submodule fails before the sync mutates anything.
+    """
+    log(stdout, "monty-sync: checking superproject worktree cleanliness")
+    if _ensure_clean_superproject(runner, config=config):
+        log(stdout, "monty-sync: checking full-monty worktree cleanliness")
+        raise _reject_changed_submodule(runner, config=config)
+    log(stdout, f"monty-sync: initializing {config.submodule_posix}")
+    _initialize_submodule(runner, config=config)
+
+
+def _read_remote_url(runner: CommandRunner, *, config: SyncConfig, remote: str) -> str | None:
+    """Return the configured URL for `remote`, or `None` when it is missing."""
+    invocation = CommandInvocation(
+        program="git",
+        args=("remote", "get-url", remote),
+        cwd=config.submodule_root,
+    )
+    outcome = runner.run(program=invocation.program, args=invocation.args, cwd=invocation.cwd)
+    if outcome.ok:
+        return outcome.stdout.strip()
+    if outcome.exit_code == GIT_NO_SUCH_REMOTE_EXIT_CODE:
+        return None
+    raise command_failure(
+        invocation,
+        outcome,
+        failure_summary="unable to inspect full-monty remotes",
+    )
+
+
+def ensure_remotes(runner: CommandRunner, *, config: SyncConfig) -> None:
+    """Validate fork remote and configure upstream remote URL."""
+    if _read_remote_url(runner, config=config, remote=config.fork_remote) is None:
+        raise MontySyncError(
+            f"fork remote `{config.fork_remote}` is missing in "
+            f"{config.submodule_posix}"
+        )
+
+    upstream_url = _read_remote_url(runner, config=config, remote=config.upstream_remote)
+    if upstream_url is None:
+        run_checked(
+            runner,
+            invocation=CommandInvocation(
+                program="git",
+                args=("remote", "add", config.upstream_remote, config.upstream_url),
+                cwd=config.submodule_root,
+            ),
+            failure_summary="unable to add upstream remote",
+        )
+        return
+
+    if upstream_url == config.upstream_url:
+        return
+
+    run_checked(
+        runner,
+        invocation=CommandInvocation(
+            program="git",
+            args=("remote", "set-url", config.upstream_remote, config.upstream_url),
+            cwd=config.submodule_root,
+        ),
+        failure_summary="unable to update upstream remote URL",
+    )
+
+
+def run_verification_gates(runner: CommandRunner, *, config: SyncConfig) -> None:
+    """Run required repository verification gates after sync.
+
+    All targets run in one `make` invocation so start-up and Makefile parsing
+    are paid once. When that batch fails, targets are re-run one at a time to
+    identify the failing gate.
+    """
+    targets = config.verification_targets
+    if not targets:
+        return
+
+    batch = CommandInvocation(program="make", args=targets, cwd=config.repo_root)
+    outcome = runner.run(program=batch.program, args=batch.args, cwd=batch.cwd)
+    if outcome.ok:
+        return
+
+    for target in targets:
+        run_checked(
+            runner,
+            invocation=CommandInvocation(program="make", args=(target,), cwd=config.repo_root),
+            failure_summary=f"verification gate `{target}` failed",
+        )
+    raise command_failure(batch, outcome, failure_summary="verification gates failed")
@@ -12,16 +12,31 @@ post-sync verification gates. Run from repository root with `make monty-sync`.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import contextlib
+from dataclasses import dataclass, field
+import functools
 from pathlib import Path
 import sys
-from typing import TYPE_CHECKING, Protocol, TextIO
+from typing import TYPE_CHECKING, TextIO
 
-from cuprum import ExecutionContext, Program, scoped
+from cuprum import ExecutionContext, Program, current_context, scoped
 
 from _cuprum_helpers import build_catalogue, build_commands
+from _monty_sync_steps import (
+    CommandInvocation,
+    CommandOutcome,
+    CommandRunner,
+    MontySyncError,
+    ensure_remotes,
+    log,
+    run_checked,
+    run_preflight,
+    run_verification_gates,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
     from cuprum import SafeCmd
 
 
@@ -29,26 +44,6 @@ GIT = Program("git")
 MAKE = Program("make")
 CATALOGUE = build_catalogue(GIT, MAKE)
 COMMANDS = build_commands(catalogue=CATALOGUE, programs=(GIT, MAKE))
-git = COMMANDS[GIT]
-make = COMMANDS[MAKE]
-
-
-@dataclass(frozen=True)
-class CommandOutcome:
-    """Represent one command result consumed by sync orchestration.
-
-    Parameters
-    ----------
-    ok : bool
-    stdout : str
-    stderr : str
-    exit_code : int
-    """
-
-    ok: bool
-    stdout: str
-    stderr: str
-    exit_code: int
 
 
 @dataclass(frozen=True)
@@ -65,6 +60,21 @@ class SyncConfig:
     upstream_url : str
     upstream_branch : str
     verification_targets : tuple[str, ...]
+    submodule_jobs : int
+        Number of submodules Git may fetch or clone concurrently.
+    fetch_jobs : int
+        Number of remotes Git may fetch concurrently.
+
+    Attributes
+    ----------
+    submodule_root : Path
+        Absolute submodule checkout path, derived from ``repo_root``.
+    submodule_posix : str
+        POSIX form of ``submodule_path`` used in git arguments and messages.
+    fork_tracking_ref : str
+        Remote-tracking ref for the fork branch, such as ``origin/main``.
+    upstream_tracking_ref : str
+        Remote-tracking ref for the upstream branch, such as ``upstream/main``.
     """
 
     repo_root: Path
@@ -75,58 +85,46 @@ class SyncConfig:
     upstream_url: str = "https://github.com/pydantic/monty.git"
     upstream_branch: str = "main"
     verification_targets: tuple[str, ...] = ("check-fmt", "lint", "test")
-
-    @property
-    def submodule_root(self) -> Path:
-        return self.repo_root / self.submodule_path
+    submodule_jobs: int = 8
+    fetch_jobs: int = 2
+    submodule_root: Path = field(init=False, repr=False, compare=False)
+    submodule_posix: str = field(init=False, repr=False, compare=False)
+    fork_tracking_ref: str = field(init=False, repr=False, compare=False)
+    upstream_tracking_ref: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Derived values are computed once; the config is frozen so they
+        # cannot drift from the fields they are built from.
+        object.__setattr__(self, "submodule_root", self.repo_root / self.submodule_path)
+        object.__setattr__(self, "submodule_posix", self.submodule_path.as_posix())
+        object.__setattr__(self, "fork_tracking_ref", f"{self.fork_remote}/{self.fork_branch}")
+        object.__setattr__(
+            self,
+            "upstream_tracking_ref",
+            f"{self.upstream_remote}/{self.upstream_branch}",
+        )
 
 
-@dataclass(frozen=True)
-class CommandInvocation:
-    """Describe one command invocation expected by a command runner.
+class CuprumRunner:
+    """Execute command invocations via Cuprum safe command wrappers.
 
-    Parameters
-    ----------
-    program : str
-    args : tuple[str, ...]
-    cwd : Path
+    `session()` enters the Cuprum allowlist scope once for a whole sync. A
+    command run outside any session enters the scope itself, because Cuprum
+    treats an empty allowlist as permissive.
     """
 
-    program: str
-    args: tuple[str, ...]
-    cwd: Path
-
-
-class CommandRunner(Protocol):
-    """Define the command runner contract used by monty-sync orchestration."""
-
-    def run(self, *, program: str, args: tuple[str, ...], cwd: Path) -> CommandOutcome:
-        """Execute one command invocation.
-
-        Parameters
-        ----------
-        program : str
-        args : tuple[str, ...]
-        cwd : Path
-
-        Returns
-        -------
-        CommandOutcome
-        """
-
-
-class MontySyncError(RuntimeError):
-    """Signal a fail-closed monty-sync orchestration error."""
-
-
-class CuprumRunner:
-    """Execute command invocations via Cuprum safe command wrappers."""
+    @staticmethod
+    @contextlib.contextmanager
+    def session() -> Generator[None]:
+        """Enter the catalogue allowlist scope for a sequence of commands."""
+        with scoped(allowlist=CATALOGUE.allowlist):
+            yield
 
     def run(self, *, program: str, args: tuple[str, ...], cwd: Path) -> CommandOutcome:
         command = _resolve_command(program)
-        context = ExecutionContext(cwd=cwd.as_posix())
-        with scoped(allowlist=CATALOGUE.allowlist):
-            result = command(*args).run_sync(context=context)
+        scope = contextlib.nullcontext() if current_context().allowlist else self.session()
+        with scope:
+            result = command(*args).run_sync(context=_execution_context(cwd))
         return CommandOutcome(
             ok=result.ok,
             stdout=result.stdout,
@@ -135,55 +133,23 @@ class CuprumRunner:
         )
 
 
-def _resolve_command(program: str) -> "SafeCmd":
-    """Resolve supported command name to Cuprum command handle."""
-    if program == "git":
-        return git
-    if program == "make":
-        return make
-    raise MontySyncError(f"unsupported command `{program}`")
-
-
-def _run_checked(
-    runner: CommandRunner,
-    *,
-    invocation: CommandInvocation,
-    failure_summary: str,
-) -> CommandOutcome:
-    """Execute one command and raise `MontySyncError` on failure."""
-    outcome = runner.run(program=invocation.program, args=invocation.args, cwd=invocation.cwd)
-    if outcome.ok:
-        return outcome
-
-    details = outcome.stderr.strip() or outcome.stdout.strip() or "no error detail"
-    command_text = " ".join((invocation.program, *invocation.args))
-    raise MontySyncError(
-        f"{failure_summary}: `{command_text}` failed with exit code "
-        f"{outcome.exit_code}: {details}"
-    )
-
+@functools.cache
+def _execution_context(cwd: Path) -> ExecutionContext:
+    """Return the shared, immutable Cuprum execution context for `cwd`."""
+    return ExecutionContext(cwd=cwd.as_posix())
 
-def _log(stdout: TextIO, message: str) -> None:
-    """Write one log line to output stream."""
-    stdout.write(f"{message}\n")
 
-
-def _ensure_clean_worktree(runner: CommandRunner, *, cwd: Path, scope_name: str) -> None:
-    """Fail when `cwd` worktree has tracked or untracked changes."""
-    outcome = _run_checked(
-        runner,
-        invocation=CommandInvocation(program="git", args=("status", "--porcelain"), cwd=cwd),
-        failure_summary=f"unable to inspect {scope_name} worktree status",
-    )
-    if outcome.stdout.strip():
-        raise MontySyncError(
-            f"{scope_name} worktree is not clean; commit or stash changes before running monty sync"
-        )
+def _resolve_command(program: str) -> "SafeCmd":
+    """Resolve supported command name to Cuprum command handle."""
+    try:
+        return COMMANDS[Program(program)]
+    except KeyError:
+        raise MontySyncError(f"unsupported command `{program}`") from None
 
 
 def _read_head_revision(runner: CommandRunner, *, cwd: Path) -> str:
     """Return current HEAD revision for one repository checkout."""
-    outcome = _run_checked(
+    outcome = run_checked(
         runner,
         invocation=CommandInvocation(program="git", args=("rev-parse", "HEAD"), cwd=cwd),
         failure_summary="unable to read HEAD revision",
@@ -191,62 +157,37 @@ def _read_head_revision(runner: CommandRunner, *, cwd: Path) -> str:
     return outcome.stdout.strip()
 
 
-def _ensure_remotes(runner: CommandRunner, *, config: SyncConfig) -> None:
-    """Validate fork remote and configure upstream remote URL."""
-    remotes_outcome = _run_checked(
-        runner,
-        invocation=CommandInvocation(program="git", args=("remote",), cwd=config.submodule_root),
-        failure_summary="unable to list full-monty remotes",
-    )
-    remotes = {line.strip() for line in remotes_outcome.stdout.splitlines() if line.strip()}
-    if config.fork_remote not in remotes:
-        raise MontySyncError(
-            f"fork remote `{config.fork_remote}` is missing in "
-            f"{config.submodule_path.as_posix()}"
-        )
-
-    if config.upstream_remote not in remotes:
-        _run_checked(
-            runner,
-            invocation=CommandInvocation(
-                program="git",
-                args=("remote", "add", config.upstream_remote, config.upstream_url),
-                cwd=config.submodule_root,
-            ),
-            failure_summary="unable to add upstream remote",
-        )
-        return
+def _fetch_remotes(runner: CommandRunner, *, config: SyncConfig) -> None:
+    """Fetch fork and upstream remotes with one `git fetch --multiple` call.
 
-    _run_checked(
+    Git fetches the remotes in parallel, up to ``config.fetch_jobs`` at once.
+    """
+    run_checked(
         runner,
         invocation=CommandInvocation(
             program="git",
-            args=("remote", "set-url", config.upstream_remote, config.upstream_url),
+            args=(
+                "fetch",
+                "--prune",
+                "--multiple",
+                f"--jobs={config.fetch_jobs}",
+                config.fork_remote,
+                config.upstream_remote,
+            ),
             cwd=config.submodule_root,
         ),
-        failure_summary="unable to update upstream remote URL",
+        failure_summary="unable to fetch fork and upstream remotes",
     )
 
 
 def _refresh_submodule_branch(runner: CommandRunner, *, config: SyncConfig) -> None:
-    """Refresh local fork branch by fast-forwarding with upstream branch."""
-    _run_checked(
-        runner,
-        invocation=CommandInvocation(
-            program="git",
-            args=("fetch", "--prune", config.fork_remote),
-            cwd=config.submodule_root,
-        ),
-        failure_summary="unable to fetch fork remote",
-    )
-    _run_checked(
-        runner,
-        invocation=CommandInvocation(
-            program="git", args=("fetch", "--prune", config.upstream_remote), cwd=config.submodule_root
-        ),
-        failure_summary="unable to fetch upstream remote",
-    )
-    _run_checked(
+    """Refresh local fork branch by fast-forwarding with upstream branch.
+
+    The merge runs with ``--no-stat`` so a large fast-forward does not pay for
+    a diffstat that nothing reads.
+    """
+    _fetch_remotes(runner, config=config)
+    run_checked(
         runner,
         invocation=CommandInvocation(
             program="git",
@@ -254,33 +195,28 @@ def _refresh_submodule_branch(runner: CommandRunner, *, config: SyncConfig) -> N
                 "checkout",
                 "-B",
                 config.fork_branch,
-                f"{config.fork_remote}/{config.fork_branch}",
+                config.fork_tracking_ref,
             ),
             cwd=config.submodule_root,
         ),
         failure_summary="unable to refresh local fork branch",
     )
-    _run_checked(
+    run_checked(
         runner,
         invocation=CommandInvocation(
             program="git",
-            args=("merge", "--ff-only", f"{config.upstream_remote}/{config.upstream_branch}"),
+            args=(
+                "merge",
+                "--ff-only",
+                "--no-stat",
+                config.upstream_tracking_ref,
+            ),
             cwd=config.submodule_root,
         ),
         failure_summary="unable to fast-forward fork branch with upstream; resolve divergence manually",
     )
 
 
-def _run_verification_gates(runner: CommandRunner, *, config: SyncConfig) -> None:
-    """Run required repository verification gates after sync."""
-    for target in config.verification_targets:
-        _run_checked(
-            runner,
-            invocation=CommandInvocation(program="make", args=(target,), cwd=config.repo_root),
-            failure_summary=f"verification gate `{target}` failed",
-        )
-
-
 def run_monty_sync(
     runner: CommandRunner,
     *,
@@ -304,52 +240,37 @@ def run_monty_sync(
     ------
     MontySyncError
     """
-    _log(stdout, "monty-sync: checking superproject worktree cleanliness")
-    _ensure_clean_worktree(runner, cwd=config.repo_root, scope_name="superproject")
-
-    _log(stdout, f"monty-sync: initializing {config.submodule_path.as_posix()}")
-    _run_checked(
-        runner,
-        invocation=CommandInvocation(
-            program="git",
-            args=("submodule", "update", "--init", "--recursive", config.submodule_path.as_posix()),
-            cwd=config.repo_root,
-        ),
-        failure_summary="unable to initialize full-monty submodule",
-    )
-
-    _log(stdout, "monty-sync: checking full-monty worktree cleanliness")
-    _ensure_clean_worktree(runner, cwd=config.submodule_root, scope_name="full-monty submodule")
+    run_preflight(runner, config=config, stdout=stdout)
 
-    _log(stdout, "monty-sync: ensuring remote configuration")
-    _ensure_remotes(runner, config=config)
+    log(stdout, "monty-sync: ensuring remote configuration")
+    ensure_remotes(runner, config=config)
 
     before_revision = _read_head_revision(runner, cwd=config.submodule_root)
 
-    _log(stdout, "monty-sync: fetching remotes and refreshing fork branch")
+    log(stdout, "monty-sync: fetching remotes and refreshing fork branch")
     _refresh_submodule_branch(runner, config=config)
 
     after_revision = _read_head_revision(runner, cwd=config.submodule_root)
 
     if before_revision == after_revision:
-        _log(stdout, "monty-sync: submodule revision already current")
+        log(stdout, "monty-sync: submodule revision already current")
     else:
-        _log(stdout, f"monty-sync: submodule revision updated {before_revision} -> {after_revision}")
+        log(stdout, f"monty-sync: submodule revision updated {before_revision} -> {after_revision}")
 
-    _run_checked(
+    run_checked(
         runner,
         invocation=CommandInvocation(
             program="git",
-            args=("add", config.submodule_path.as_posix()),
+            args=("add", config.submodule_posix),
             cwd=config.repo_root,
         ),
         failure_summary="unable to stage submodule pointer update",
     )
-    _log(stdout, "monty-sync: staged submodule pointer update")
+    log(stdout, "monty-sync: staged submodule pointer update")
 
-    _log(stdout, "monty-sync: running verification gates")
-    _run_verification_gates(runner, config=config)
-    _log(stdout, "monty-sync: completed successfully")
+    log(stdout, "monty-sync: running verification gates")
+    run_verification_gates(runner, config=config)
+    log(stdout, "monty-sync: completed successfully")
 
 
 def _parse_args(argv: list[str]) -> None:
@@ -384,8 +305,10 @@ def main(argv: list[str] | None = None) -> int:
 
     repo_root = Path(__file__).resolve().parents[1]
     config = SyncConfig(repo_root=repo_root)
+    runner = CuprumRunner()
     try:
-        run_monty_sync(CuprumRunner(), config=config, stdout=sys.stdout)
+        with runner.session():
+            run_monty_sync(runner, config=config, stdout=sys.stdout)
     except MontySyncError as error:
         print(f"monty-sync error: {error}", file=sys.stderr)
         return 1
@@ -23,8 +23,9 @@ import pytest
 
 
 SCRIPTS_ROOT: Path = Path(__file__).resolve().parents[1]
-if str(SCRIPTS_ROOT) not in sys.path:
-    sys.path.insert(0, str(SCRIPTS_ROOT))
+_SCRIPTS_ROOT_ENTRY: str = str(SCRIPTS_ROOT)
+if _SCRIPTS_ROOT_ENTRY not in sys.path:
+    sys.path.insert(0, _SCRIPTS_ROOT_ENTRY)
 
 import verify_script_baseline as baseline
 
@@ -56,12 +57,17 @@ def write_text() -> Callable[[Path, str], None]:
     Returns
     -------
     Callable[[Path, str], None]
-        Helper that writes text after creating parent directories.
+        Helper that writes text after creating parent directories. Each
+        parent directory is created at most once per test.
     """
+    known_dirs: set[Path] = set()
 
     def _write_text(path: Path, text: str) -> None:
         """Write UTF-8 text to a path, creating parent directories."""
-        path.parent.mkdir(parents=True, exist_ok=True)
+        parent = path.parent
+        if parent not in known_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            known_dirs.add(parent)
         path.write_text(text, encoding="utf-8")
 
     return _write_text
@@ -19,7 +19,7 @@ Compose scenario stubs and execute them through `QueueRunner`:
 config = build_config(tmp_path)
 runner = QueueRunner(
     build_preflight_stubs(config)
-    + (build_remote_listing_stub(config, remotes=("origin", "upstream")),)
+    + build_remote_lookup_stubs(config, remotes=("origin", "upstream"))
     + build_sync_operation_stubs(
         config,
         remotes=("origin", "upstream"),
@@ -33,15 +33,24 @@ runner = QueueRunner(
 
 from __future__ import annotations
 
-from collections import deque
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
+from io import StringIO
 from pathlib import Path
 
+from _monty_sync_steps import GIT_NO_SUCH_REMOTE_EXIT_CODE
 import monty_sync
 
 
-@dataclass(frozen=True)
+FORK_URL = "git@github.com:leynos/full-monty.git"
+_SUCCESS = monty_sync.CommandOutcome(ok=True, stdout="", stderr="", exit_code=0)
+_STATUS_ARGS = ("status", "--porcelain")
+_SUPERPROJECT_STATUS_ARGS = (*_STATUS_ARGS, "--ignore-submodules=none")
+_REV_PARSE_HEAD_ARGS = ("rev-parse", "HEAD")
+_DEFAULT_REVISION = "1" * 40
+
+
+@dataclass(frozen=True, slots=True)
 class CommandInvocation:
     """Represent one command invocation for queued test stubs.
 
@@ -60,7 +69,7 @@ class CommandInvocation:
     cwd: Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandStub:
     """Bind an expected invocation to its deterministic outcome.
 
@@ -76,6 +85,21 @@ class CommandStub:
     outcome: monty_sync.CommandOutcome
 
 
+class _NullStdout(StringIO):
+    """Text stream that discards everything written to it."""
+
+    def write(self, text: str, /) -> int:
+        """Discard ``text`` and report it as written."""
+        return len(text)
+
+    def writelines(self, lines: Iterable[str], /) -> None:
+        """Discard ``lines``."""
+
+
+# Shared sink for tests that never inspect sync progress output.
+NULL_STDOUT = _NullStdout()
+
+
 def build_config(tmp_path: Path) -> monty_sync.SyncConfig:
     """Create a sync configuration rooted in a temporary repository.
 
@@ -122,72 +146,132 @@ def invocation(
     return CommandInvocation(program=program, args=args, cwd=cwd)
 
 
-def build_remote_listing_stub(
+def _stub(
     config: monty_sync.SyncConfig,
+    program: str,
+    args: tuple[str, ...],
     *,
-    remotes: Sequence[str],
+    submodule: bool = False,
+    outcome: monty_sync.CommandOutcome = _SUCCESS,
 ) -> CommandStub:
-    """Build a submodule-scoped ``git remote`` listing stub.
+    """Bind one invocation to ``outcome``, succeeding by default."""
+    return CommandStub(
+        invocation(config, program=program, args=args, submodule=submodule),
+        outcome,
+    )
+
+
+def build_remote_lookup_stubs(
+    config: monty_sync.SyncConfig,
+    *,
+    remotes: Sequence[str],
+) -> tuple[CommandStub, ...]:
+    """Build submodule-scoped ``git remote get-url`` lookup stubs.
 
     Parameters
     ----------
     config : monty_sync.SyncConfig
-        Sync configuration that defines command working directories.
+        Sync configuration that defines remote names and URLs.
     remotes : Sequence[str]
-        Remote names returned by ``git remote`` in stdout order.
+        Remote names configured in the submodule checkout.
 
     Returns
     -------
-    CommandStub
-        Stub producing one newline-terminated remote per entry.
+    tuple[CommandStub, ...]
+        Fork lookup stub, followed by the upstream lookup stub when the fork
+        remote exists. Missing remotes fail with ``git``'s no-such-remote exit
+        code.
     """
-    return CommandStub(
-        invocation(config, program="git", args=("remote",), submodule=True),
-        successful_outcome("".join(f"{remote}\n" for remote in remotes)),
+    fork_stub = _build_remote_url_stub(
+        config,
+        remote=config.fork_remote,
+        url=FORK_URL if config.fork_remote in remotes else None,
+    )
+    if config.fork_remote not in remotes:
+        return (fork_stub,)
+    return (
+        fork_stub,
+        _build_remote_url_stub(
+            config,
+            remote=config.upstream_remote,
+            url=config.upstream_url if config.upstream_remote in remotes else None,
+        ),
     )
 
 
-def build_preflight_stubs(config: monty_sync.SyncConfig) -> tuple[CommandStub, ...]:
+def _build_remote_url_stub(
+    config: monty_sync.SyncConfig,
+    *,
+    remote: str,
+    url: str | None,
+) -> CommandStub:
+    """Build one ``git remote get-url`` stub; ``None`` marks a missing remote."""
+    outcome = (
+        successful_outcome(f"{url}\n")
+        if url is not None
+        else failure_outcome(
+            f"error: No such remote '{remote}'",
+            exit_code=GIT_NO_SUCH_REMOTE_EXIT_CODE,
+        )
+    )
+    return _stub(config, "git", ("remote", "get-url", remote), submodule=True, outcome=outcome)
+
+
+def build_preflight_stubs(
+    config: monty_sync.SyncConfig,
+    *,
+    submodule_status: str | None = None,
+) -> tuple[CommandStub, ...]:
     """Build stubs for preflight checks and submodule initialization.
 
     Parameters
     ----------
     config : monty_sync.SyncConfig
         Sync configuration that defines repository and submodule paths.
+    submodule_status : str | None, default=None
+        Porcelain output of the submodule-scoped status check. When ``None``
+        the superproject reports a clean submodule and the submodule is
+        initialized; otherwise the superproject reports the submodule as
+        modified and preflight fails after that check.
 
     Returns
     -------
     tuple[CommandStub, ...]
-        Stubs for superproject cleanliness, submodule update, and submodule
-        cleanliness checks.
+        Stubs for superproject cleanliness followed by either the submodule
+        update or the submodule cleanliness check.
     """
-    return (
-        CommandStub(
-            invocation(config, program="git", args=("status", "--porcelain")),
-            successful_outcome(),
-        ),
-        CommandStub(
-            invocation(
-                config,
-                program="git",
-                args=(
-                    "submodule",
-                    "update",
-                    "--init",
-                    "--recursive",
-                    config.submodule_path.as_posix(),
-                ),
-            ),
-            successful_outcome(),
-        ),
-        CommandStub(
-            invocation(
+    sub_posix = config.submodule_posix
+    superproject_status = "" if submodule_status is None else f" M {sub_posix}\n"
+    status_stub = _stub(
+        config,
+        "git",
+        _SUPERPROJECT_STATUS_ARGS,
+        outcome=successful_outcome(superproject_status),
+    )
+    if submodule_status is not None:
+        return (
+            status_stub,
+            _stub(
                 config,
-                program="git",
-                args=("status", "--porcelain"),
+                "git",
+                _STATUS_ARGS,
                 submodule=True,
+                outcome=successful_outcome(submodule_status),
+            ),
+        )
+    return (
+        status_stub,
+        _stub(
+            config,
+            "git",
+            (
+                "submodule",
+                "update",
+                "--init",
+                "--recursive",
+                f"--jobs={config.submodule_jobs}",
+                sub_posix,
             ),
-            successful_outcome(),
         ),
     )
 
@@ -204,97 +288,92 @@ def build_remote_setup_stubs(
     config : monty_sync.SyncConfig
         Sync configuration that defines remote names and URLs.
     has_upstream : bool, default=False
-        Whether the initial remote listing already includes upstream.
+        Whether the upstream remote is already configured with the expected
+        URL.
 
     Returns
     -------
     tuple[CommandStub, ...]
-        Stub sequence for ``git remote`` and the matching
-        ``git remote add|set-url`` command.
+        Stub sequence for the ``git remote get-url`` lookups and, when the
+        upstream remote is missing, the matching ``git remote add`` command.
     """
     remotes = (
         config.fork_remote,
         config.upstream_remote,
     ) if has_upstream else (config.fork_remote,)
-    remote_cmd = "set-url" if has_upstream else "add"
     return (
-        build_remote_listing_stub(config, remotes=remotes),
-        CommandStub(
-            invocation(
-                config,
-                program="git",
-                args=(
-                    "remote",
-                    remote_cmd,
-                    config.upstream_remote,
-                    config.upstream_url,
-                ),
-                submodule=True,
-            ),
-            successful_outcome(),
-        ),
+        *build_remote_lookup_stubs(config, remotes=remotes),
+        *_upstream_setup_stubs(config, remotes=remotes),
     )
 
 
-def _build_fetch_stubs_helper(config: monty_sync.SyncConfig) -> tuple[CommandStub, ...]:
-    """Build stubs for fetch operations from fork and upstream remotes."""
+def _upstream_setup_stubs(
+    config: monty_sync.SyncConfig,
+    *,
+    remotes: Sequence[str],
+) -> tuple[CommandStub, ...]:
+    """Build the ``git remote add`` stub when upstream is not yet configured."""
+    if config.upstream_remote in remotes:
+        return ()
     return (
-        CommandStub(
-            invocation(
-                config,
-                program="git",
-                args=("fetch", "--prune", config.fork_remote),
-                submodule=True,
-            ),
-            successful_outcome(),
-        ),
-        CommandStub(
-            invocation(
-                config,
-                program="git",
-                args=("fetch", "--prune", config.upstream_remote),
-                submodule=True,
-            ),
-            successful_outcome(),
+        _stub(
+            config,
+            "git",
+            ("remote", "add", config.upstream_remote, config.upstream_url),
+            submodule=True,
         ),
     )
 
 
-def _build_checkout_merge_stubs_helper(
+def _build_refresh_stubs(
     config: monty_sync.SyncConfig,
+    *,
+    remotes: Sequence[str],
+    old_revision: str,
 ) -> tuple[CommandStub, ...]:
-    """Build stubs for branch checkout and fast-forward merge operations."""
+    """Build stubs from upstream setup through the fast-forward merge."""
     return (
-        CommandStub(
-            invocation(
-                config,
-                program="git",
-                args=(
-                    "checkout",
-                    "-B",
-                    config.fork_branch,
-                    f"{config.fork_remote}/{config.fork_branch}",
-                ),
-                submodule=True,
-            ),
-            successful_outcome(),
+        *_upstream_setup_stubs(config, remotes=remotes),
+        _stub(
+            config,
+            "git",
+            _REV_PARSE_HEAD_ARGS,
+            submodule=True,
+            outcome=successful_outcome(_revision_line(old_revision)),
         ),
-        CommandStub(
-            invocation(
-                config,
-                program="git",
-                args=(
-                    "merge",
-                    "--ff-only",
-                    f"{config.upstream_remote}/{config.upstream_branch}",
-                ),
-                submodule=True,
+        _stub(
+            config,
+            "git",
+            (
+                "fetch",
+                "--prune",
+                "--multiple",
+                f"--jobs={config.fetch_jobs}",
+                config.fork_remote,
+                config.upstream_remote,
             ),
-            successful_outcome(),
+            submodule=True,
+        ),
+        _stub(
+            config,
+            "git",
+            ("checkout", "-B", config.fork_branch, config.fork_tracking_ref),
+            submodule=True,
+        ),
+        _stub(
+            config,
+            "git",
+            ("merge", "--ff-only", "--no-stat", config.upstream_tracking_ref),
+            submodule=True,
         ),
     )
 
 
+def _revision_line(revision: str) -> str:
+    """Return ``revision`` as one ``rev-parse`` output line."""
+    return revision if revision.endswith("\n") else f"{revision}\n"
+
+
 def build_sync_operation_stubs(
     config: monty_sync.SyncConfig,
     *,
@@ -318,39 +397,13 @@ def build_sync_operation_stubs(
     Returns
     -------
     tuple[CommandStub, ...]
-        Ordered stubs covering remote setup, revision capture, fetch, checkout,
-        merge, post-sync revision capture, and pointer staging.
+        Ordered stubs covering upstream setup when needed, revision capture,
+        fetch, checkout, merge, post-sync revision capture, and pointer
+        staging.
     """
-    upstream_command = "set-url" if config.upstream_remote in remotes else "add"
-    before_revision = old_revision.rstrip("\n")
-    remote_setup_stub = (
-        CommandStub(
-            invocation(
-                config,
-                program="git",
-                args=(
-                    "remote",
-                    upstream_command,
-                    config.upstream_remote,
-                    config.upstream_url,
-                ),
-                submodule=True,
-            ),
-            successful_outcome(),
-        ),
-    )
-    pre_sync_revision_stub = (
-        CommandStub(
-            invocation(config, program="git", args=("rev-parse", "HEAD"), submodule=True),
-            successful_outcome(f"{before_revision}\n"),
-        ),
-    )
     return (
-        remote_setup_stub
-        + pre_sync_revision_stub
-        + _build_fetch_stubs_helper(config)
-        + _build_checkout_merge_stubs_helper(config)
-        + post_sync_stubs(config, new_revision=new_revision)
+        *_build_refresh_stubs(config, remotes=remotes, old_revision=old_revision),
+        *post_sync_stubs(config, new_revision=new_revision),
     )
 
 
@@ -359,7 +412,7 @@ def build_sync_stubs(
     old_rev: str,
     new_rev: str,
 ) -> tuple[CommandStub, ...]:
-    """Build stubs for sync operations after remotes are already listed.
+    """Build stubs for sync operations once both remotes are configured.
 
     Parameters
     ----------
@@ -373,18 +426,19 @@ def build_sync_stubs(
     Returns
     -------
     tuple[CommandStub, ...]
-        Sync-operation subset that excludes the initial remote listing stub.
+        Sync-operation stubs from pre-sync revision capture through pointer
+        staging.
     """
     return build_sync_operation_stubs(
         config,
         remotes=(config.fork_remote, config.upstream_remote),
         old_revision=old_rev,
         new_revision=new_rev,
-    )[1:]
+    )
 
 
 def build_gate_stubs(config: monty_sync.SyncConfig) -> tuple[CommandStub, ...]:
-    """Build successful stubs for configured verification gates.
+    """Build the successful batched stub for configured verification gates.
 
     Parameters
     ----------
@@ -394,22 +448,16 @@ def build_gate_stubs(config: monty_sync.SyncConfig) -> tuple[CommandStub, ...]:
     Returns
     -------
     tuple[CommandStub, ...]
-        One successful ``make <target>`` stub for each verification target.
+        One successful ``make <targets...>`` stub covering every target.
     """
-    return tuple(
-        CommandStub(
-            invocation(config, program="make", args=(target,)),
-            successful_outcome(),
-        )
-        for target in config.verification_targets
-    )
+    return _gate_stubs(config, None)
 
 
 def happy_path_stubs_up_to_sync(
     config: monty_sync.SyncConfig,
     *,
     has_upstream: bool = True,
-    old_revision: str = "1111111111111111111111111111111111111111",
+    old_revision: str = _DEFAULT_REVISION,
 ) -> tuple[CommandStub, ...]:
     """Build happy-path stubs from preflight checks through merge.
 
@@ -432,21 +480,16 @@ def happy_path_stubs_up_to_sync(
         config.upstream_remote,
     ) if has_upstream else (config.fork_remote,)
     return (
-        build_preflight_stubs(config)
-        + (build_remote_listing_stub(config, remotes=remotes),)
-        + build_sync_operation_stubs(
-            config,
-            remotes=remotes,
-            old_revision=old_revision,
-            new_revision=old_revision,
-        )[:6]
+        *build_preflight_stubs(config),
+        *build_remote_lookup_stubs(config, remotes=remotes),
+        *_build_refresh_stubs(config, remotes=remotes, old_revision=old_revision),
     )
 
 
 def post_sync_stubs(
     config: monty_sync.SyncConfig,
     *,
-    new_revision: str = "1111111111111111111111111111111111111111",
+    new_revision: str = _DEFAULT_REVISION,
 ) -> tuple[CommandStub, ...]:
     """Build stubs for post-sync revision capture and pointer staging.
 
@@ -462,16 +505,15 @@ def post_sync_stubs(
     tuple[CommandStub, ...]
         Stubs for post-sync revision capture and ``git add`` pointer staging.
     """
-    normalized_new_revision = new_revision.rstrip("\n")
     return (
-        CommandStub(
-            invocation(config, program="git", args=("rev-parse", "HEAD"), submodule=True),
-            successful_outcome(f"{normalized_new_revision}\n"),
-        ),
-        CommandStub(
-            invocation(config, program="git", args=("add", config.submodule_path.as_posix())),
-            successful_outcome(),
+        _stub(
+            config,
+            "git",
+            _REV_PARSE_HEAD_ARGS,
+            submodule=True,
+            outcome=successful_outcome(_revision_line(new_revision)),
         ),
+        _stub(config, "git", ("add", config.submodule_posix)),
     )
 
 
@@ -487,30 +529,39 @@ def gate_stubs(
     config : monty_sync.SyncConfig
         Sync configuration containing verification targets.
     fail_at : str | None, default=None
-        Target name that should fail; later targets are omitted.
+        Target name that should fail. The batched ``make`` run then fails and
+        targets are replayed one at a time up to and including ``fail_at``.
 
     Returns
     -------
     tuple[CommandStub, ...]
-        Gate stubs up to and including ``fail_at`` when provided.
+        The batched gate stub, followed by the per-target replay stubs when
+        ``fail_at`` is provided.
     """
-    stubs: list[CommandStub] = []
-    for target in config.verification_targets:
-        if target == fail_at:
-            stubs.append(
-                CommandStub(
-                    invocation(config, program="make", args=(target,)),
-                    failure_outcome("clippy: simulated lint failure"),
-                )
-            )
-            break
-        stubs.append(
-            CommandStub(
-                invocation(config, program="make", args=(target,)),
-                successful_outcome(),
+    return _gate_stubs(config, fail_at)
+
+
+def _gate_stubs(config: monty_sync.SyncConfig, fail_at: str | None) -> tuple[CommandStub, ...]:
+    """Return the gate stubs for ``config``, failing at ``fail_at`` when set."""
+    targets = config.verification_targets
+    if fail_at is None:
+        return (_stub(config, "make", targets),)
+
+    batch_failure = failure_outcome("make: *** verification gates failed", exit_code=2)
+    cut = targets.index(fail_at) if fail_at in targets else len(targets)
+    return (
+        _stub(config, "make", targets, outcome=batch_failure),
+        *[_stub(config, "make", (target,)) for target in targets[:cut]],
+        *[
+            _stub(
+                config,
+                "make",
+                (target,),
+                outcome=failure_outcome("clippy: simulated lint failure"),
             )
-        )
-    return tuple(stubs)
+            for target in targets[cut : cut + 1]
+        ],
+    )
 
 
 def successful_outcome(stdout: str = "") -> monty_sync.CommandOutcome:
@@ -569,7 +620,13 @@ class QueueRunner:
         stubs : Iterable[CommandStub]
             Ordered command stubs expected during the test.
         """
-        self._stubs = deque(stubs)
+        self._stubs = tuple(stubs)
+        self._keys = tuple(
+            (stub.invocation.program, stub.invocation.args, stub.invocation.cwd)
+            for stub in self._stubs
+        )
+        self._outcomes = tuple(stub.outcome for stub in self._stubs)
+        self._index = 0
         self.calls: list[CommandInvocation] = []
 
     def run(
@@ -600,20 +657,21 @@ class QueueRunner:
         AssertionError
             Raised when no stubs remain or the invocation does not match.
         """
-        if not self._stubs:
+        index = self._index
+        if index == len(self._keys):
             raise AssertionError(
                 f"unexpected command invocation `{program} {' '.join(args)}` in `{cwd}`"
             )
 
-        next_stub = self._stubs.popleft()
-        invocation = CommandInvocation(program=program, args=args, cwd=cwd)
-        self.calls.append(invocation)
-        if invocation != next_stub.invocation:
+        call = CommandInvocation(program=program, args=args, cwd=cwd)
+        self.calls.append(call)
+        self._index = index + 1
+        if (program, args, cwd) != self._keys[index]:
             raise AssertionError(
                 "command invocation mismatch: "
-                f"expected `{next_stub.invocation}` got `{invocation}`"
+                f"expected `{self._stubs[index].invocation}` got `{call}`"
             )
-        return next_stub.outcome
+        return self._outcomes[index]
 
     def assert_exhausted(self) -> None:
         """Assert that all queued stubs were consumed.
@@ -627,6 +685,5 @@ class QueueRunner:
         AssertionError
             Raised when queued stubs remain after the test run.
         """
-        assert not self._stubs, (
-            f"expected {len(self._stubs)} additional command invocation(s)"
-        )
+        remaining = len(self._keys) - self._index
+        assert not remaining, f"expected {remaining} additional command invocation(s)"
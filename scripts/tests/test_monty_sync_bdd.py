@@ -13,10 +13,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from io import StringIO
-from pathlib import Path
 
 import pytest
-from pytest_bdd import given, scenarios, then, when
+from pytest_bdd import given, parsers, scenarios, then, when
 
 import monty_sync
 
@@ -25,7 +24,7 @@ from monty_sync_test_helpers import (
     QueueRunner,
     build_config,
     build_preflight_stubs,
-    build_remote_listing_stub,
+    build_remote_lookup_stubs,
     build_sync_operation_stubs,
     gate_stubs,
     invocation,
@@ -81,6 +80,16 @@ GATE_FAILURE_SCENARIO = SyncScenarioParams(
 )
 
 
+# Maps the scenario phrase in "Given a <phrase> command sequence" steps to its
+# command sequence parameters.
+_SCENARIO_TABLE: dict[str, SyncScenarioParams] = {
+    "monty sync happy-path": HAPPY_PATH_SCENARIO,
+    "dirty superproject": DIRTY_SUPERPROJECT_SCENARIO,
+    "missing fork remote": MISSING_REMOTE_SCENARIO,
+    "verification gate failure": GATE_FAILURE_SCENARIO,
+}
+
+
 @dataclass
 class ScenarioState:
     """Mutable state shared across scenario steps."""
@@ -100,20 +109,24 @@ def _build_preflight_stubs(
     if superproject_dirty:
         return (
             CommandStub(
-                invocation(config, program="git", args=("status", "--porcelain")),
+                invocation(
+                    config,
+                    program="git",
+                    args=("status", "--porcelain", "--ignore-submodules=none"),
+                ),
                 successful_outcome(" M README.md\n"),
             ),
         )
     return build_preflight_stubs(config)
 
 
-def _build_remote_check_stub(
+def _build_remote_check_stubs(
     config: monty_sync.SyncConfig,
     *,
     remotes: tuple[str, ...],
-) -> CommandStub:
-    """Build stub for remote listing in the submodule checkout."""
-    return build_remote_listing_stub(config, remotes=remotes)
+) -> tuple[CommandStub, ...]:
+    """Build stubs for remote lookups in the submodule checkout."""
+    return build_remote_lookup_stubs(config, remotes=remotes)
 
 
 def _build_sync_operation_stubs(
@@ -153,9 +166,9 @@ def _build_sync_command_sequence(
     if scenario.superproject_dirty:
         return preflight_stubs
 
-    remote_check_stub = _build_remote_check_stub(config, remotes=scenario.remotes)
+    remote_check_stubs = _build_remote_check_stubs(config, remotes=scenario.remotes)
     if "origin" not in scenario.remotes:
-        return (*preflight_stubs, remote_check_stub)
+        return (*preflight_stubs, *remote_check_stubs)
 
     sync_stubs = _build_sync_operation_stubs(
         config,
@@ -165,61 +178,31 @@ def _build_sync_command_sequence(
     )
 
     verification_stubs = _build_gate_stubs(config, gate_to_fail=scenario.gate_to_fail)
-    return (*preflight_stubs, remote_check_stub, *sync_stubs, *verification_stubs)
-
-
-@pytest.fixture
-def scenario_state(tmp_path: Path) -> ScenarioState:
-    """Create isolated scenario state with a repository-root configuration."""
-    return ScenarioState(config=build_config(tmp_path))
-
-
-def build_bdd_happy_path_stubs(config: monty_sync.SyncConfig) -> tuple[CommandStub, ...]:
-    """Build command stub sequence for BDD happy-path sync workflow."""
-    return _build_sync_command_sequence(config, HAPPY_PATH_SCENARIO)
-
+    return (*preflight_stubs, *remote_check_stubs, *sync_stubs, *verification_stubs)
 
-def build_bdd_dirty_superproject_stubs(config: monty_sync.SyncConfig) -> tuple[CommandStub, ...]:
-    """Build command stub sequence for dirty superproject scenario."""
-    return _build_sync_command_sequence(config, DIRTY_SUPERPROJECT_SCENARIO)
 
+@pytest.fixture(scope="module")
+def scenario_config(tmp_path_factory: pytest.TempPathFactory) -> monty_sync.SyncConfig:
+    """Create one repository-root configuration shared by every scenario.
 
-def build_bdd_missing_remote_stubs(config: monty_sync.SyncConfig) -> tuple[CommandStub, ...]:
-    """Build command stub sequence for missing fork remote scenario."""
-    return _build_sync_command_sequence(config, MISSING_REMOTE_SCENARIO)
+    Scenarios drive the workflow through stubbed commands and never write to
+    the repository directory, so a single temporary root suffices.
+    """
+    return build_config(tmp_path_factory.mktemp("monty-sync-bdd"))
 
 
-def build_bdd_gate_failure_stubs(config: monty_sync.SyncConfig) -> tuple[CommandStub, ...]:
-    """Build command stub sequence for verification gate failure scenario."""
-    return _build_sync_command_sequence(config, GATE_FAILURE_SCENARIO)
-
-
-@given("a monty sync happy-path command sequence")
-def given_happy_path_sequence(scenario_state: ScenarioState) -> None:
-    """Prepare successful command queue for full sync workflow."""
-    config = scenario_state.config
-    scenario_state.runner = QueueRunner(build_bdd_happy_path_stubs(config))
-
-
-@given("a dirty superproject command sequence")
-def given_dirty_superproject_sequence(scenario_state: ScenarioState) -> None:
-    """Prepare command queue that fails at superproject cleanliness check."""
-    config = scenario_state.config
-    scenario_state.runner = QueueRunner(build_bdd_dirty_superproject_stubs(config))
-
-
-@given("a missing fork remote command sequence")
-def given_missing_remote_sequence(scenario_state: ScenarioState) -> None:
-    """Prepare queue where fork remote is missing in submodule checkout."""
-    config = scenario_state.config
-    scenario_state.runner = QueueRunner(build_bdd_missing_remote_stubs(config))
+@pytest.fixture
+def scenario_state(scenario_config: monty_sync.SyncConfig) -> ScenarioState:
+    """Create isolated scenario state with a repository-root configuration."""
+    return ScenarioState(config=scenario_config)
 
 
-@given("a verification gate failure command sequence")
-def given_gate_failure_sequence(scenario_state: ScenarioState) -> None:
-    """Prepare queue where lint gate fails after sync operations."""
-    config = scenario_state.config
-    scenario_state.runner = QueueRunner(build_bdd_gate_failure_stubs(config))
+@given(parsers.parse("a {phrase} command sequence"))
+def given_command_sequence(scenario_state: ScenarioState, phrase: str) -> None:
+    """Prepare the command queue for the scenario named by `phrase`."""
+    scenario_state.runner = QueueRunner(
+        _build_sync_command_sequence(scenario_state.config, _SCENARIO_TABLE[phrase])
+    )
 
 
 @when("I run the monty sync workflow")
@@ -11,6 +11,10 @@ make script-test
 
 from __future__ import annotations
 
+from pathlib import Path
+from types import SimpleNamespace
+
+from cuprum import ExecutionContext, current_context
 import pytest
 
 import monty_sync
@@ -61,6 +65,49 @@ def test_main_success_runs_monty_sync(
     assert isinstance(recorded.get("config"), monty_sync.SyncConfig)
 
 
+def test_main_runs_sync_inside_allowlist_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify the CLI enters the Cuprum allowlist scope around the whole sync."""
+    recorded: dict[str, object] = {}
+
+    def _fake_sync(
+        runner: monty_sync.CommandRunner,
+        *,
+        config: monty_sync.SyncConfig,
+        stdout,
+    ) -> None:
+        recorded["allowlist"] = current_context().allowlist
+
+    monkeypatch.setattr(monty_sync, "run_monty_sync", _fake_sync)
+
+    assert monty_sync.main([]) == 0
+    assert recorded["allowlist"] == monty_sync.CATALOGUE.allowlist
+
+
+def test_cuprum_runner_scopes_commands_run_outside_a_session(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Verify a command run without `session()` still gets the allowlist."""
+    recorded: dict[str, object] = {}
+
+    def _run_sync(*, context: object) -> SimpleNamespace:
+        recorded["allowlist"] = current_context().allowlist
+        return SimpleNamespace(ok=True, stdout="", stderr="", exit_code=0)
+
+    monkeypatch.setattr(
+        monty_sync,
+        "_resolve_command",
+        lambda program: lambda *args: SimpleNamespace(run_sync=_run_sync),
+    )
+
+    outcome = monty_sync.CuprumRunner().run(program="git", args=("status",), cwd=tmp_path)
+
+    assert outcome.ok
+    assert recorded["allowlist"] == monty_sync.CATALOGUE.allowlist
+
+
 def test_main_accepts_help() -> None:
     """Verify help flag returns zero without running sync."""
     assert monty_sync.main(["--help"]) == 0
@@ -75,3 +122,31 @@ def test_main_rejects_unknown_arguments(
 
     assert exit_code == 2
     assert "unsupported arguments" in captured.err
+
+
+def test_cuprum_runner_runs_each_command_in_its_working_directory(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Verify commands execute in the working directory they were given."""
+    working_dirs: list[str] = []
+
+    def _run_sync(*, context: ExecutionContext) -> SimpleNamespace:
+        working_dirs.append(context.cwd)
+        return SimpleNamespace(ok=True, stdout="", stderr="", exit_code=0)
+
+    monkeypatch.setattr(
+        monty_sync,
+        "_resolve_command",
+        lambda program: lambda *args: SimpleNamespace(run_sync=_run_sync),
+    )
+    runner = monty_sync.CuprumRunner()
+
+    for cwd in (tmp_path, tmp_path / "sub", tmp_path):
+        runner.run(program="git", args=("status",), cwd=cwd)
+
+    assert working_dirs == [
+        tmp_path.as_posix(),
+        (tmp_path / "sub").as_posix(),
+        tmp_path.as_posix(),
+    ]
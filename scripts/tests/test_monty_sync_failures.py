@@ -11,7 +11,6 @@ make script-test
 
 from __future__ import annotations
 
-from io import StringIO
 from pathlib import Path
 
 import pytest
@@ -19,32 +18,97 @@ import pytest
 import monty_sync
 
 from monty_sync_test_helpers import (
+    NULL_STDOUT,
+    CommandStub,
     QueueRunner,
     build_config,
     build_preflight_stubs,
-    build_remote_listing_stub,
+    build_remote_lookup_stubs,
+    failure_outcome,
     gate_stubs,
     happy_path_stubs_up_to_sync,
+    invocation,
     post_sync_stubs,
+    successful_outcome,
 )
 
 
-def test_run_monty_sync_fails_when_fork_remote_missing(tmp_path: Path) -> None:
+@pytest.fixture(scope="module")
+def config(tmp_path_factory: pytest.TempPathFactory) -> monty_sync.SyncConfig:
+    """Return one configuration shared by this module's stub-driven tests."""
+    return build_config(tmp_path_factory.mktemp("monty_sync"))
+
+
+def test_run_monty_sync_fails_when_fork_remote_missing(config: monty_sync.SyncConfig) -> None:
     """Verify missing origin remote fails with deterministic error."""
-    config = build_config(tmp_path)
     runner = QueueRunner(
         build_preflight_stubs(config)
-        + (build_remote_listing_stub(config, remotes=("upstream",)),)
+        + build_remote_lookup_stubs(config, remotes=("upstream",))
     )
 
     with pytest.raises(monty_sync.MontySyncError, match="fork remote `origin` is missing"):
-        monty_sync.run_monty_sync(runner, config=config, stdout=StringIO())
+        monty_sync.run_monty_sync(runner, config=config, stdout=NULL_STDOUT)
+    runner.assert_exhausted()
+
+
+def test_run_monty_sync_fails_when_submodule_worktree_dirty(config: monty_sync.SyncConfig) -> None:
+    """Verify submodule changes seen by the superproject get a precise error."""
+    runner = QueueRunner(build_preflight_stubs(config, submodule_status=" M src/lib.rs\n"))
+
+    with pytest.raises(
+        monty_sync.MontySyncError,
+        match="full-monty submodule worktree is not clean",
+    ):
+        monty_sync.run_monty_sync(runner, config=config, stdout=NULL_STDOUT)
+    runner.assert_exhausted()
+
+
+def test_run_monty_sync_treats_staged_submodule_change_as_superproject_dirty(
+    config: monty_sync.SyncConfig,
+) -> None:
+    """Verify a staged submodule pointer still fails the superproject check."""
+    runner = QueueRunner(
+        (
+            CommandStub(
+                invocation(
+                    config,
+                    program="git",
+                    args=("status", "--porcelain", "--ignore-submodules=none"),
+                ),
+                successful_outcome(f"M  {config.submodule_posix}\n"),
+            ),
+        )
+    )
+
+    with pytest.raises(monty_sync.MontySyncError, match="superproject worktree is not clean"):
+        monty_sync.run_monty_sync(runner, config=config, stdout=NULL_STDOUT)
+    runner.assert_exhausted()
+
+
+def test_run_monty_sync_fails_when_remote_lookup_errors(config: monty_sync.SyncConfig) -> None:
+    """Verify remote lookup errors other than a missing remote fail closed."""
+    runner = QueueRunner(
+        build_preflight_stubs(config)
+        + (
+            CommandStub(
+                invocation(
+                    config,
+                    program="git",
+                    args=("remote", "get-url", config.fork_remote),
+                    submodule=True,
+                ),
+                failure_outcome("fatal: not a git repository", exit_code=128),
+            ),
+        )
+    )
+
+    with pytest.raises(monty_sync.MontySyncError, match="unable to inspect full-monty remotes"):
+        monty_sync.run_monty_sync(runner, config=config, stdout=NULL_STDOUT)
     runner.assert_exhausted()
 
 
-def test_run_monty_sync_fails_when_verification_gate_fails(tmp_path: Path) -> None:
+def test_run_monty_sync_fails_when_verification_gate_fails(config: monty_sync.SyncConfig) -> None:
     """Verify gate failure aborts sync flow with non-success result."""
-    config = build_config(tmp_path)
     rev = "1111111111111111111111111111111111111111"
     runner = QueueRunner(
         happy_path_stubs_up_to_sync(config, has_upstream=True, old_revision=rev)
@@ -53,5 +117,69 @@ def test_run_monty_sync_fails_when_verification_gate_fails(tmp_path: Path) -> No
     )
 
     with pytest.raises(monty_sync.MontySyncError, match="verification gate `lint` failed"):
-        monty_sync.run_monty_sync(runner, config=config, stdout=StringIO())
+        monty_sync.run_monty_sync(runner, config=config, stdout=NULL_STDOUT)
+    runner.assert_exhausted()
+
+
+def test_run_monty_sync_fails_when_fetch_fails(config: monty_sync.SyncConfig) -> None:
+    """Verify a failed remote fetch stops the sync before the branch refresh."""
+    runner = QueueRunner(
+        build_preflight_stubs(config)
+        + build_remote_lookup_stubs(config, remotes=("origin", "upstream"))
+        + (
+            CommandStub(
+                invocation(config, program="git", args=("rev-parse", "HEAD"), submodule=True),
+                successful_outcome("1111111111111111111111111111111111111111\n"),
+            ),
+            CommandStub(
+                invocation(
+                    config,
+                    program="git",
+                    args=(
+                        "fetch",
+                        "--prune",
+                        "--multiple",
+                        f"--jobs={config.fetch_jobs}",
+                        config.fork_remote,
+                        config.upstream_remote,
+                    ),
+                    submodule=True,
+                ),
+                failure_outcome("fatal: unable to access fork"),
+            ),
+        )
+    )
+
+    with pytest.raises(
+        monty_sync.MontySyncError,
+        match="unable to fetch fork and upstream remotes",
+    ):
+        monty_sync.run_monty_sync(runner, config=config, stdout=NULL_STDOUT)
+    runner.assert_exhausted()
+
+
+def test_cuprum_runner_rejects_unsupported_program(tmp_path: Path) -> None:
+    """Verify programs outside the Cuprum catalogue fail before execution."""
+    with pytest.raises(monty_sync.MontySyncError, match="unsupported command `curl`"):
+        monty_sync.CuprumRunner().run(program="curl", args=(), cwd=tmp_path)
+
+
+def test_run_monty_sync_reports_batched_gate_failure_when_replay_passes(
+    config: monty_sync.SyncConfig,
+) -> None:
+    """Verify a batch failure that does not reproduce per target still fails."""
+    rev = "1111111111111111111111111111111111111111"
+    replay_stubs = tuple(
+        CommandStub(invocation(config, program="make", args=(target,)), successful_outcome())
+        for target in config.verification_targets
+    )
+    runner = QueueRunner(
+        happy_path_stubs_up_to_sync(config, has_upstream=True, old_revision=rev)
+        + post_sync_stubs(config, new_revision=rev)
+        + gate_stubs(config, fail_at="lint")[:1]
+        + replay_stubs
+    )
+
+    with pytest.raises(monty_sync.MontySyncError, match="verification gates failed"):
+        monty_sync.run_monty_sync(runner, config=config, stdout=NULL_STDOUT)
     runner.assert_exhausted()
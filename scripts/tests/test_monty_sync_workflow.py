@@ -11,6 +11,8 @@ make script-test
 
 from __future__ import annotations
 
+from collections import deque
+import functools
 from io import StringIO
 from pathlib import Path
 
@@ -19,6 +21,7 @@ import pytest
 import monty_sync
 
 from monty_sync_test_helpers import (
+    NULL_STDOUT,
     CommandInvocation,
     CommandStub,
     QueueRunner,
@@ -35,11 +38,22 @@ from monty_sync_test_helpers import (
 )
 
 
+@pytest.fixture(scope="module")
+def config(tmp_path_factory: pytest.TempPathFactory) -> monty_sync.SyncConfig:
+    """Return one configuration shared by this module's stub-driven tests."""
+    return build_config(tmp_path_factory.mktemp("monty_sync"))
+
+
 class AnyOrderRunner:
     """Runner that validates invocations against an unordered stub collection."""
 
     def __init__(self, stubs: tuple[CommandStub, ...]) -> None:
-        self._remaining = list(stubs)
+        # Index outcomes by invocation so each call is matched in O(1); the
+        # per-key deques keep duplicate stubs in declaration order.
+        self._pending: dict[CommandInvocation, deque[monty_sync.CommandOutcome]] = {}
+        for stub in stubs:
+            self._pending.setdefault(stub.invocation, deque()).append(stub.outcome)
+        self._count = len(stubs)
         self.calls: list[CommandInvocation] = []
 
     def run(
@@ -51,40 +65,41 @@ class AnyOrderRunner:
     ) -> monty_sync.CommandOutcome:
         call = CommandInvocation(program=program, args=args, cwd=cwd)
         self.calls.append(call)
-        for index, stub in enumerate(self._remaining):
-            if stub.invocation == call:
-                return self._remaining.pop(index).outcome
+        outcomes = self._pending.get(call)
+        if outcomes:
+            self._count -= 1
+            return outcomes.popleft()
         raise AssertionError(
             f"unexpected command invocation `{program} {' '.join(args)}` in `{cwd}`"
         )
 
     def assert_exhausted(self) -> None:
         """Assert that all expected command stubs were consumed."""
-        assert not self._remaining, (
-            f"expected {len(self._remaining)} additional command invocation(s)"
-        )
+        assert not self._count, f"expected {self._count} additional command invocation(s)"
 
 
+@functools.lru_cache(maxsize=8)
 def build_happy_path_command_stubs(config: monty_sync.SyncConfig) -> tuple[CommandStub, ...]:
     """Build command stub sequence for happy-path monty-sync workflow."""
     old_rev = "1111111111111111111111111111111111111111"
     new_rev = "2222222222222222222222222222222222222222"
     return (
-        build_preflight_stubs(config)
-        + build_remote_setup_stubs(config, has_upstream=True)
-        + build_sync_stubs(config, old_rev, new_rev)
-        + build_gate_stubs(config)
+        *build_preflight_stubs(config),
+        *build_remote_setup_stubs(config, has_upstream=True),
+        *build_sync_stubs(config, old_rev, new_rev),
+        *build_gate_stubs(config),
     )
 
 
+@functools.lru_cache(maxsize=8)
 def build_noop_revision_command_stubs(config: monty_sync.SyncConfig) -> tuple[CommandStub, ...]:
     """Build command stub sequence where the submodule revision does not change."""
     revision = "1111111111111111111111111111111111111111"
     return (
-        build_preflight_stubs(config)
-        + build_remote_setup_stubs(config, has_upstream=True)
-        + build_sync_stubs(config, revision, revision)
-        + build_gate_stubs(config)
+        *build_preflight_stubs(config),
+        *build_remote_setup_stubs(config, has_upstream=True),
+        *build_sync_stubs(config, revision, revision),
+        *build_gate_stubs(config),
     )
 
 
@@ -93,22 +108,22 @@ def _assert_staging_precedes_verification_gates(
     config: monty_sync.SyncConfig,
 ) -> None:
     """Assert submodule pointer staging occurs before verification gates."""
-    staging_idx = runner.calls.index(
-        invocation(config, program="git", args=("add", config.submodule_path.as_posix()))
-    )
-    first_gate_idx = next(
-        idx
-        for idx, call in enumerate(runner.calls)
-        if call.program == "make" and call.args in (("check-fmt",), ("lint",), ("test",))
-    )
-    assert staging_idx < first_gate_idx
+    staging = invocation(config, program="git", args=("add", config.submodule_posix))
+    staged = False
+    for call in runner.calls:
+        if call == staging:
+            staged = True
+        elif call.program == "make":
+            break
+    else:
+        raise AssertionError("expected a verification gate invocation")
+    assert staged
 
 
 def test_run_monty_sync_happy_path_updates_revision_and_runs_gates(
-    tmp_path: Path,
+    config: monty_sync.SyncConfig,
 ) -> None:
     """Verify successful sync updates revision and executes gate targets."""
-    config = build_config(tmp_path)
     runner = AnyOrderRunner(build_happy_path_command_stubs(config))
     stdout = StringIO()
 
@@ -123,10 +138,9 @@ def test_run_monty_sync_happy_path_updates_revision_and_runs_gates(
 
 
 def test_run_monty_sync_no_revision_change_logs_already_current_and_runs_gates(
-    tmp_path: Path,
+    config: monty_sync.SyncConfig,
 ) -> None:
     """Verify no-op sync still stages pointer and runs verification gates."""
-    config = build_config(tmp_path)
     runner = AnyOrderRunner(build_noop_revision_command_stubs(config))
     stdout = StringIO()
 
@@ -137,16 +151,30 @@ def test_run_monty_sync_no_revision_change_logs_already_current_and_runs_gates(
     assert "monty-sync: submodule revision already current" in output
     assert "monty-sync: submodule revision updated" not in output
     _assert_staging_precedes_verification_gates(runner, config)
-    assert invocation(config, program="make", args=("check-fmt",)) in runner.calls
-    assert invocation(config, program="make", args=("lint",)) in runner.calls
-    assert invocation(config, program="make", args=("test",)) in runner.calls
+    assert (
+        invocation(config, program="make", args=("check-fmt", "lint", "test")) in runner.calls
+    )
+
+
+def test_sync_config_derives_submodule_locations(tmp_path: Path) -> None:
+    """Verify derived fields follow the configured submodule path and remotes."""
+    config = monty_sync.SyncConfig(
+        repo_root=tmp_path, submodule_path=Path("vendor") / "monty"
+    )
+
+    assert config.submodule_root == tmp_path / "vendor" / "monty"
+    assert config.submodule_posix == "vendor/monty"
+    assert config.fork_tracking_ref == "origin/main"
+    assert config.upstream_tracking_ref == "upstream/main"
+    assert config == monty_sync.SyncConfig(
+        repo_root=tmp_path, submodule_path=Path("vendor/monty")
+    )
 
 
 def test_run_monty_sync_initializes_submodule_before_submodule_operations(
-    tmp_path: Path,
+    config: monty_sync.SyncConfig,
 ) -> None:
     """Verify submodule initialization occurs before submodule-scoped commands."""
-    config = build_config(tmp_path)
     rev = "1111111111111111111111111111111111111111"
     runner = AnyOrderRunner(
         happy_path_stubs_up_to_sync(config, has_upstream=False, old_revision=rev)
@@ -154,42 +182,110 @@ def test_run_monty_sync_initializes_submodule_before_submodule_operations(
         + gate_stubs(config)
     )
 
-    monty_sync.run_monty_sync(runner, config=config, stdout=StringIO())
+    monty_sync.run_monty_sync(runner, config=config, stdout=NULL_STDOUT)
     runner.assert_exhausted()
 
-    submodule_update_idx = runner.calls.index(
+    submodule_update = invocation(
+        config,
+        program="git",
+        args=(
+            "submodule",
+            "update",
+            "--init",
+            "--recursive",
+            f"--jobs={config.submodule_jobs}",
+            config.submodule_posix,
+        ),
+    )
+    updated_before_first_submodule_call = False
+    for call in runner.calls:
+        if call == submodule_update:
+            updated_before_first_submodule_call = True
+        elif call.cwd == config.submodule_root:
+            break
+    assert updated_before_first_submodule_call
+
+
+def test_run_monty_sync_fails_when_submodule_has_unrecorded_commits(
+    config: monty_sync.SyncConfig,
+) -> None:
+    """Verify a clean submodule on unrecorded commits fails before any update."""
+    runner = QueueRunner(build_preflight_stubs(config, submodule_status=""))
+    stdout = StringIO()
+
+    with pytest.raises(
+        monty_sync.MontySyncError,
+        match="checked out at a commit the superproject has not recorded",
+    ):
+        monty_sync.run_monty_sync(runner, config=config, stdout=stdout)
+
+    runner.assert_exhausted()
+    assert "monty-sync: checking full-monty worktree cleanliness" in stdout.getvalue()
+
+
+def test_run_monty_sync_updates_stale_upstream_url(config: monty_sync.SyncConfig) -> None:
+    """Verify a stale upstream URL is rewritten before fetching."""
+    stale_lookup = CommandStub(
         invocation(
             config,
             program="git",
-            args=(
-                "submodule",
-                "update",
-                "--init",
-                "--recursive",
-                config.submodule_path.as_posix(),
-            ),
-        )
+            args=("remote", "get-url", config.upstream_remote),
+            submodule=True,
+        ),
+        successful_outcome("https://example.invalid/monty.git\n"),
+    )
+    set_url = CommandStub(
+        invocation(
+            config,
+            program="git",
+            args=("remote", "set-url", config.upstream_remote, config.upstream_url),
+            submodule=True,
+        ),
+        successful_outcome(),
+    )
+    runner = QueueRunner(
+        build_preflight_stubs(config)
+        + build_remote_setup_stubs(config, has_upstream=True)[:1]
+        + (stale_lookup, set_url)
+        + build_sync_stubs(config, "1" * 40, "1" * 40)
+        + build_gate_stubs(config)
+    )
+
+    monty_sync.run_monty_sync(runner, config=config, stdout=NULL_STDOUT)
+
+    runner.assert_exhausted()
+
+
+def test_run_monty_sync_skips_make_without_verification_targets(tmp_path: Path) -> None:
+    """Verify an empty target list never runs make's default goal."""
+    config = monty_sync.SyncConfig(
+        repo_root=tmp_path / "repo",
+        verification_targets=(),
     )
-    first_submodule_scoped_idx = next(
-        idx
-        for idx, call in enumerate(runner.calls)
-        if call.cwd == config.submodule_root
+    runner = QueueRunner(
+        happy_path_stubs_up_to_sync(config) + post_sync_stubs(config)
     )
-    assert submodule_update_idx < first_submodule_scoped_idx
+
+    monty_sync.run_monty_sync(runner, config=config, stdout=NULL_STDOUT)
+
+    runner.assert_exhausted()
 
 
-def test_run_monty_sync_fails_when_superproject_dirty(tmp_path: Path) -> None:
-    """Verify dirty superproject worktree fails before sync mutation."""
-    config = build_config(tmp_path)
+def test_run_monty_sync_fails_when_superproject_dirty(config: monty_sync.SyncConfig) -> None:
+    """Verify a dirty superproject fails before `git submodule update` runs."""
     runner = QueueRunner(
         (
             CommandStub(
-                invocation(config, program="git", args=("status", "--porcelain")),
+                invocation(
+                    config,
+                    program="git",
+                    args=("status", "--porcelain", "--ignore-submodules=none"),
+                ),
                 successful_outcome(" M docs/roadmap.md\n"),
             ),
         )
     )
 
     with pytest.raises(monty_sync.MontySyncError, match="superproject worktree is not clean"):
-        monty_sync.run_monty_sync(runner, config=config, stdout=StringIO())
+        monty_sync.run_monty_sync(runner, config=config, stdout=NULL_STDOUT)
     runner.assert_exhausted()
@@ -22,22 +22,11 @@ import pytest
 
 import verify_script_baseline as baseline
 
-
-VALID_SCRIPT: str = """#!/usr/bin/env -S uv run python
-# /// script
-# requires-python = ">=3.13"
-# dependencies = ["cuprum==0.1.0"]
-# ///
-from __future__ import annotations
-
-from cuprum import Program, scoped, sh
-
-TOFU = Program("tofu")
-tofu = sh.make(TOFU)
-
-with scoped(allowlist=frozenset([TOFU])):
-    result = tofu("plan").run_sync()
-"""
+from verify_script_baseline_test_helpers import (
+    FORBIDDEN_SCRIPT_CASES,
+    METADATA_EDGE_CASES,
+    VALID_SCRIPT,
+)
 
 
 @dataclass
@@ -75,6 +64,16 @@ def _validate_script_with_issue_assertion(
     ), f"expected issue fragment not found: {scenario.expected_fragment}"
 
 
+def _assert_issues_contain_all(
+    issues: list[baseline.BaselineIssue],
+    fragments: tuple[str, ...],
+) -> None:
+    """Assert each fragment appears in some issue, scanning messages once."""
+    messages = "\n".join(issue.message for issue in issues)
+    missing = [fragment for fragment in fragments if fragment not in messages]
+    assert not missing, f"expected issue fragments not found: {', '.join(missing)}"
+
+
 def test_discover_roadmap_scripts_skips_helpers_and_tests(
     scripts_root: Path,
     write_text: Callable[[Path, str], None],
@@ -190,42 +189,10 @@ def test_validate_script_reports_missing_uv_metadata(
     create_matching_test(script_path, scripts_root)
 
     issues = baseline.validate_script(script_path, scripts_root)
-    assert any(
-        "uv shebang" in issue.message for issue in issues
-    ), "expected issue fragment not found: uv shebang"
-    assert any(
-        "uv metadata block" in issue.message for issue in issues
-    ), "expected issue fragment not found: uv metadata block"
-
-
-@pytest.mark.parametrize(
-    "test_case",
-    [
-        ("import subprocess\n", "subprocess imports are forbidden"),
-        ("from subprocess import run\n", "subprocess imports are forbidden"),
-        ("import plumbum\n", "Plumbum imports are forbidden"),
-        ("from cuprum import local\n", "forbidden in baseline scripts"),
-        ("from cuprum.cmd import git\n", "cuprum.cmd"),
-        ("import os\nos.system('echo hi')\n", "os.system"),
-        ("import os\nos.popen('echo hi')\n", "os.system/os.popen"),
-        (
-            "import subprocess\nsubprocess.run(['echo'])\n",
-            "subprocess invocation is forbidden",
-        ),
-        (
-            "import subprocess\nsubprocess.call(['echo'])\n",
-            "subprocess invocation is forbidden",
-        ),
-        (
-            "import subprocess\nsubprocess.Popen(['echo'])\n",
-            "subprocess invocation is forbidden",
-        ),
-        (
-            "import subprocess\nsubprocess.check_output(['echo'])\n",
-            "subprocess invocation is forbidden",
-        ),
-    ],
-)
+    _assert_issues_contain_all(issues, ("uv shebang", "uv metadata block"))
+
+
+@pytest.mark.parametrize("test_case", FORBIDDEN_SCRIPT_CASES)
 def test_validate_script_reports_forbidden_command_patterns(
     scripts_root: Path,
     write_text: Callable[[Path, str], None],
@@ -243,21 +210,21 @@ def test_validate_script_reports_forbidden_command_patterns(
     create_matching_test : Callable[[Path, Path], Path]
         Matching-test creation helper fixture.
     test_case : tuple[str, str]
-        Snippet and expected message fragment pair.
+        Script source and expected message fragment pair.
 
     Returns
     -------
     None
         This test asserts forbidden-pattern diagnostics.
     """
-    snippet, expected_fragment = test_case
+    source, expected_fragment = test_case
     _validate_script_with_issue_assertion(
         scripts_root,
         write_text,
         create_matching_test,
         ValidationScenario(
             script_name="forbidden.py",
-            script_content=VALID_SCRIPT + "\n" + snippet,
+            script_content=source,
             expected_fragment=expected_fragment,
         ),
     )
@@ -308,38 +275,7 @@ with scoped(allowlist=frozenset([TOFU])):
     ), "expected issue fragment not found: run_sync()"
 
 
-@pytest.mark.parametrize(
-    "test_case",
-    [
-        (
-            """#!/usr/bin/env -S uv run python
-# /// script
-# requires-python = ">=3.12"
-# dependencies = ["cuprum==0.1.0"]
-# ///
-print("hello")
-""",
-            "requires-python",
-        ),
-        (
-            """#!/usr/bin/env -S uv run python
-# /// script
-# requires-python = ">=3.13"
-# ///
-print("hello")
-""",
-            "dependencies",
-        ),
-        (
-            """#!/usr/bin/env -S uv run python
-# /// script
-# requires-python = ">=3.13"
-print("hello")
-""",
-            "uv metadata block",
-        ),
-    ],
-)
+@pytest.mark.parametrize("test_case", METADATA_EDGE_CASES)
 def test_validate_script_reports_metadata_edge_cases(
     scripts_root: Path,
     write_text: Callable[[Path, str], None],
@@ -0,0 +1,108 @@
+"""Shared validation cases for `scripts/verify_script_baseline.py` tests.
+
+Purpose
+-------
+Hold the script sources and parametrize case tables used by the validation
+suite, so each case carries an explicit pytest id without crowding the test
+module.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+
+VALID_SCRIPT: str = """#!/usr/bin/env -S uv run python
+# /// script
+# requires-python = ">=3.13"
+# dependencies = ["cuprum==0.1.0"]
+# ///
+from __future__ import annotations
+
+from cuprum import Program, scoped, sh
+
+TOFU = Program("tofu")
+tofu = sh.make(TOFU)
+
+with scoped(allowlist=frozenset([TOFU])):
+    result = tofu("plan").run_sync()
+"""
+
+# Forbidden snippets appended to ``VALID_SCRIPT``; full sources are built once
+# at import rather than concatenated inside every parametrized case.
+_FORBIDDEN_SNIPPETS: tuple[tuple[str, str, str], ...] = (
+    ("import-subprocess", "import subprocess\n", "subprocess imports are forbidden"),
+    (
+        "from-subprocess-import-run",
+        "from subprocess import run\n",
+        "subprocess imports are forbidden",
+    ),
+    ("import-plumbum", "import plumbum\n", "Plumbum imports are forbidden"),
+    ("from-cuprum-import-local", "from cuprum import local\n", "forbidden in baseline scripts"),
+    ("from-cuprum-cmd-import", "from cuprum.cmd import git\n", "cuprum.cmd"),
+    ("os-system", "import os\nos.system('echo hi')\n", "os.system"),
+    ("os-popen", "import os\nos.popen('echo hi')\n", "os.system/os.popen"),
+    (
+        "subprocess-run",
+        "import subprocess\nsubprocess.run(['echo'])\n",
+        "subprocess invocation is forbidden",
+    ),
+    (
+        "subprocess-call",
+        "import subprocess\nsubprocess.call(['echo'])\n",
+        "subprocess invocation is forbidden",
+    ),
+    (
+        "subprocess-popen",
+        "import subprocess\nsubprocess.Popen(['echo'])\n",
+        "subprocess invocation is forbidden",
+    ),
+    (
+        "subprocess-check-output",
+        "import subprocess\nsubprocess.check_output(['echo'])\n",
+        "subprocess invocation is forbidden",
+    ),
+)
+FORBIDDEN_SCRIPT_CASES = [
+    pytest.param((f"{VALID_SCRIPT}\n{snippet}", fragment), id=case_id)
+    for case_id, snippet, fragment in _FORBIDDEN_SNIPPETS
+]
+
+METADATA_EDGE_CASES = [
+    pytest.param(
+        (
+            """#!/usr/bin/env -S uv run python
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["cuprum==0.1.0"]
+# ///
+print("hello")
+""",
+            "requires-python",
+        ),
+        id="requires-python-too-old",
+    ),
+    pytest.param(
+        (
+            """#!/usr/bin/env -S uv run python
+# /// script
+# requires-python = ">=3.13"
+# ///
+print("hello")
+""",
+            "dependencies",
+        ),
+        id="missing-dependencies",
+    ),
+    pytest.param(
+        (
+            """#!/usr/bin/env -S uv run python
+# /// script
+# requires-python = ">=3.13"
+print("hello")
+""",
+            "uv metadata block",
+        ),
+        id="unterminated-metadata-block",
+    ),
+]
@@ -30,6 +30,10 @@ import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from astroid import nodes
 
 UV_SHEBANG: str = "#!/usr/bin/env -S uv run python"
 UV_BLOCK_START: str = "# /// script"
@@ -267,22 +271,35 @@ def _is_sh_make_call(func_node) -> bool:
             return False
 
 
-def _detect_cuprum_usage(script_text: str) -> bool:
-    """Detect whether script uses Cuprum Program or sh.make constructs.
+def _parse_script(script_text: str) -> nodes.Module | None:
+    """Parse script text with ``astroid``.
 
-    Uses AST parsing when available, falls back to heuristic search.
+    Returns ``None`` when ``astroid`` is unavailable or the source does not parse,
+    so callers fall back to text heuristics.
     """
     try:
         import astroid
-        from astroid import nodes
     except ImportError:
-        return "Program(" in script_text or "sh.make(" in script_text
+        return None
 
     try:
         tree = astroid.parse(script_text)
     except astroid.AstroidSyntaxError:
+        return None
+    return tree
+
+
+def _detect_cuprum_usage(script_text: str) -> bool:
+    """Detect whether script uses Cuprum Program or sh.make constructs.
+
+    Uses AST parsing when available, falls back to heuristic search.
+    """
+    tree = _parse_script(script_text)
+    if tree is None:
         return "Program(" in script_text or "sh.make(" in script_text
 
+    from astroid import nodes
+
     for call_node in tree.nodes_of_class(nodes.Call):
         match call_node.func:
             case nodes.Name(name="Program"):
@@ -331,15 +348,9 @@ def _has_cuprum_run_calls(tree) -> bool:
 
 def _run_invocation_present(script_text: str) -> bool:
     """Return whether Cuprum run invocation requirements are satisfied."""
-    try:
-        import astroid
-    except ImportError:
-        return bool("run_sync(" in script_text or re.search(r"\.run\(", script_text))
-
-    try:
-        tree = astroid.parse(script_text)
-    except astroid.AstroidSyntaxError:
-        # Fall back to text heuristics when parsing fails on syntactically invalid scripts.
+    tree = _parse_script(script_text)
+    if tree is None:
+        # Fall back to text heuristics when ``astroid`` is missing or parsing fails.
         return bool("run_sync(" in script_text or re.search(r"\.run\(", script_text))
 
     return _has_cuprum_imports(tree) and _has_cuprum_run_calls(tree)